@@ -2,18 +2,24 @@
 
 import argparse
 import logging
-import signal
+import os
+import pickle
 import sys
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 from typing import List, Optional
 
+from lxml import etree
+
 from config import Config, validate_config
 from feeds import FeedFetcher, Article
 from content import ContentExtractor
+from http_session import create_session
 from llm import ClaudeAgent
-from rss_generator import generate_rss_feed
+from rss_generator import FeedItem, generate_rss_feed
 
 # Setup logging
 def setup_logging():
@@ -37,34 +43,68 @@ def setup_logging():
 
 logger = logging.getLogger(__name__)
 
-
-def _load_existing_feed(feed_path: str) -> tuple[set[str], list[dict]]:
-    """Return (existing_urls, existing_items) from feed.xml, or (set(), []) if missing."""
+def _parse_existing_feed(path: Path) -> tuple[set[str], list[FeedItem]]:
+    """Parse (existing_urls, existing_items) out of a feed.xml file."""
     existing_urls: set[str] = set()
-    existing_items: list[dict] = []
+    existing_items: list[FeedItem] = []
+    # Stream items and discard each one once read, so memory stays flat
+    # however large feed.xml grows
+    for _, item in etree.iterparse(str(path), tag='item'):
+        url = item.findtext('guid') or item.findtext('link')
+        if url:
+            existing_urls.add(url)
+            existing_items.append(FeedItem(
+                url=url,
+                title=(item.findtext('title') or '').strip(),
+                description=(item.findtext('description') or '').strip(),
+                pub_date=(item.findtext('pubDate') or '').strip(),
+                source=(item.findtext('source') or '').strip(),
+            ))
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    return existing_urls, existing_items
+
+
+def _load_existing_feed(feed_path: str) -> tuple[set[str], list[FeedItem]]:
+    """Return (existing_urls, existing_items) from feed.xml, or (set(), []) if missing.
+
+    The parsed result is pickled to Config.FEED_INDEX_PATH, keyed on the
+    feed's mtime and size, so repeat runs against an unchanged feed.xml
+    (e.g. back-to-back --test runs) skip the XML parse entirely.
+    """
     path = Path(feed_path)
     if not path.exists():
-        return existing_urls, existing_items
-    tree = ET.parse(path)
-    channel = tree.getroot().find('channel')
-    if channel is None:
-        return existing_urls, existing_items
-    for item in channel.findall('item'):
-        guid_el = item.find('guid')
-        link_el = item.find('link')
-        url = (guid_el.text if guid_el is not None else None) or \
-              (link_el.text if link_el is not None else None)
-        if not url:
-            continue
-        existing_urls.add(url)
-        existing_items.append({
-            'url': url,
-            'title': (item.findtext('title') or '').strip(),
-            'description': (item.findtext('description') or '').strip(),
-            'pub_date': (item.findtext('pubDate') or '').strip(),
-            'source': (item.findtext('source') or '').strip(),
-        })
-    return existing_urls, existing_items
+        return set(), []
+
+    stat = path.stat()
+    # Leading tag invalidates indexes pickled before items were FeedItems
+    key = ('feeditem', str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    index_path = Path(Config.FEED_INDEX_PATH)
+
+    try:
+        with open(index_path, 'rb') as f:
+            cached_key, cached = pickle.load(f)
+        if cached_key == key:
+            logger.debug(f"Loaded existing feed index from {index_path}")
+            return cached
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable feed index {index_path}: {e}")
+
+    result = _parse_existing_feed(path)
+
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.warning(f"Could not write feed index {index_path}: {e}")
+
+    return result
 
 
 class NewsAgent:
@@ -78,8 +118,10 @@ class NewsAgent:
         logger.info("Initializing News Agent...")
 
         self.existing_urls, self.existing_items = _load_existing_feed(Config.FEED_PATH)
-        self.feed_fetcher = FeedFetcher()
-        self.content_extractor = ContentExtractor()
+        # One connection pool shared by feed fetching and content extraction
+        self.session = create_session()
+        self.feed_fetcher = FeedFetcher(session=self.session)
+        self.content_extractor = ContentExtractor(session=self.session)
         self.llm_agent = ClaudeAgent()
         self.interesting_articles: List[Article] = []
 
@@ -90,22 +132,40 @@ class NewsAgent:
             'articles_interesting': 0,
             'errors': 0
         }
+        self._stats_lock = threading.Lock()
+        self._deadline = time.monotonic() + Config.MAX_RUNTIME_SECONDS
 
         logger.info(f"Loaded {len(self.existing_items)} existing items from feed")
         logger.info("News Agent initialized")
 
     def _setup_timeout(self):
-        """Setup timeout handler to prevent infinite runs."""
-        def timeout_handler(signum, frame):
-            logger.error(f"Agent timeout after {Config.MAX_RUNTIME_SECONDS} seconds")
-            raise TimeoutError("Agent execution exceeded maximum runtime")
+        """Start the runtime budget that guards against infinite runs.
 
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(Config.MAX_RUNTIME_SECONDS)
+        A monotonic deadline is checked between phases and used as the wait
+        timeout for worker threads. Unlike SIGALRM this works off the main
+        thread and on every platform. Page fetches are bounded by their own
+        request timeouts; Claude calls get the deadline itself, which caps
+        each request's timeout and stops retries once it has passed.
+        """
+        self._deadline = time.monotonic() + Config.MAX_RUNTIME_SECONDS
 
-    def _cancel_timeout(self):
-        """Cancel the timeout alarm."""
-        signal.alarm(0)
+    def _time_remaining(self) -> float:
+        """Return seconds left in the runtime budget.
+
+        Raises:
+            TimeoutError: If the budget is already spent
+        """
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Agent execution exceeded maximum runtime ({Config.MAX_RUNTIME_SECONDS}s)"
+            )
+        return remaining
+
+    def _increment(self, stat: str, amount: int = 1):
+        """Increment a run statistic (safe to call from worker threads)."""
+        with self._stats_lock:
+            self.stats[stat] += amount
 
     def fetch_articles(self) -> List[Article]:
         """Fetch new articles from RSS feeds.
@@ -115,46 +175,20 @@ class NewsAgent:
         """
         logger.info("Fetching RSS feeds...")
 
-        # Fetch all articles from feeds
-        all_articles = self.feed_fetcher.fetch_all_feeds()
-        self.stats['articles_fetched'] = len(all_articles)
-
-        # Filter out duplicates using existing feed URLs
+        # Fetch new articles; URLs already in the feed are skipped before
+        # their entries are parsed
         dedup_urls = set() if self.test_mode else self.existing_urls
-        new_articles = self.feed_fetcher.deduplicate_articles(
-            all_articles,
-            dedup_urls
-        )
-
-        # Filter by date if configured
-        if Config.MAX_ARTICLE_AGE_DAYS > 0:
-            cutoff_date = datetime.now() - timedelta(days=Config.MAX_ARTICLE_AGE_DAYS)
-
-            filtered_articles = []
-            for article in new_articles:
-                try:
-                    article_date = datetime.fromisoformat(article.pub_date)
-                    if article_date >= cutoff_date:
-                        filtered_articles.append(article)
-                    else:
-                        logger.debug(f"Skipping old article: {article.title} ({article.pub_date})")
-                except (ValueError, TypeError):
-                    # If date parsing fails, include the article
-                    filtered_articles.append(article)
-
-            old_count = len(new_articles) - len(filtered_articles)
-            if old_count > 0:
-                logger.info(f"Filtered {old_count} articles older than {Config.MAX_ARTICLE_AGE_DAYS} days")
-
-            new_articles = filtered_articles
+        new_articles = self.feed_fetcher.fetch_all_feeds(dedup_urls)
+        self.stats['articles_fetched'] = len(new_articles)
 
         # Apply limit
-        if len(new_articles) > Config.MAX_ARTICLES_PER_RUN:
+        max_articles = Config.MAX_ARTICLES_PER_RUN
+        if len(new_articles) > max_articles:
             logger.info(
-                f"Limiting to {Config.MAX_ARTICLES_PER_RUN} articles "
+                f"Limiting to {max_articles} articles "
                 f"(found {len(new_articles)} new)"
             )
-            new_articles = new_articles[:Config.MAX_ARTICLES_PER_RUN]
+            new_articles = new_articles[:max_articles]
 
         if self.test_mode and new_articles:
             new_articles = new_articles[:1]
@@ -163,25 +197,19 @@ class NewsAgent:
         logger.info(f"Found {len(new_articles)} new articles to process")
         return new_articles
 
-    def process_article(self, article: Article) -> Optional[Article]:
-        """Process a single article through the agent pipeline.
+    def _extract_article_content(self, article: Article) -> Optional[str]:
+        """Get the text an article should be judged on.
 
         Args:
-            article: Article to process
+            article: Article to extract
 
         Returns:
-            Article if interesting, None otherwise
+            Article text (falling back to the feed description), or None if
+            there isn't enough content to judge
         """
-        logger.info(f"Processing: {article.title[:60]}...")
-
-        if self.test_mode:
-            logger.info("Test mode: skipping LLM, assuming interested=True")
-            self.stats['articles_processed'] += 1
-            self.stats['articles_interesting'] += 1
-            return article
+        logger.info(f"Extracting: {article.title[:60]}...")
 
         try:
-            # 1. Extract full content
             logger.debug(f"Extracting content from {article.url}")
             content = self.content_extractor.extract_content(article.url)
 
@@ -191,31 +219,80 @@ class NewsAgent:
 
             if not content or len(content) < Config.MIN_ARTICLE_LENGTH:
                 logger.warning(f"Content too short, skipping")
-                self.stats['articles_processed'] += 1
+                self._increment('articles_processed')
                 return None
 
-            # 2. Check if interesting
-            logger.debug("Checking if article matches interests...")
-            interested, reasoning = self.llm_agent.check_interest(
-                article.title,
-                content,
-                article.url
-            )
+            # Only this much is sent to Claude; trim once here
+            return content[:Config.INTEREST_CONTENT_CHARS]
 
-            logger.info(f"Interested: {interested} - {reasoning[:100]}...")
+        except Exception as e:
+            logger.error(f"Error processing article: {e}", exc_info=True)
+            self._increment('errors')
+            return None
 
-            self.stats['articles_processed'] += 1
+    def process_articles(self, articles: List[Article]) -> List[Article]:
+        """Run articles through the agent pipeline.
 
-            if interested:
-                self.stats['articles_interesting'] += 1
-                return article
+        Page fetches run concurrently on a bounded thread pool (they are
+        dominated by network waits), then every article with usable content
+        is judged in a single batched Claude call.
 
-            return None
+        Args:
+            articles: Articles to process
 
-        except Exception as e:
-            logger.error(f"Error processing article: {e}", exc_info=True)
-            self.stats['errors'] += 1
-            return None
+        Returns:
+            Interesting articles, in input order
+        """
+        if self.test_mode:
+            logger.info("Test mode: skipping LLM, assuming interested=True")
+            self._increment('articles_processed', len(articles))
+            self._increment('articles_interesting', len(articles))
+            return list(articles)
+
+        # 1. Extract full content
+        max_workers = Config.MAX_WORKERS
+        logger.info(f"Extracting content for {len(articles)} articles ({max_workers} workers)...")
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            contents = list(executor.map(
+                self._extract_article_content, articles,
+                timeout=self._time_remaining(),
+            ))
+        except FuturesTimeoutError:
+            # Distinct from the builtin before Python 3.11
+            raise TimeoutError(
+                f"Agent execution exceeded maximum runtime ({Config.MAX_RUNTIME_SECONDS}s)"
+            )
+        finally:
+            # Don't block on queued work if we're unwinding (e.g. timeout)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        candidates = [
+            (article, content)
+            for article, content in zip(articles, contents)
+            if content is not None
+        ]
+        if not candidates:
+            return []
+
+        # 2. Check which ones are interesting, all in one request
+        self._time_remaining()
+        logger.info(f"Checking interest for {len(candidates)} articles...")
+        verdicts = self.llm_agent.check_interest_batch(
+            [(article.title, content, article.url) for article, content in candidates],
+            deadline=self._deadline,
+        )
+
+        interesting = []
+        for (article, _), (interested, reasoning) in zip(candidates, verdicts):
+            logger.info(f"Interested: {interested} - {article.title[:60]} - {reasoning[:100]}...")
+            self._increment('articles_processed')
+            if interested:
+                self._increment('articles_interesting')
+                interesting.append(article)
+
+        return interesting
 
     def run(self):
         """Run the news agent pipeline."""
@@ -233,17 +310,8 @@ class NewsAgent:
             if not articles:
                 logger.info("No new articles to process")
             else:
-                # Process each article
-                logger.info(f"Processing {len(articles)} articles...")
-
-                for i, article in enumerate(articles, 1):
-                    logger.info(f"\n[{i}/{len(articles)}] " + "="*50)
-                    result = self.process_article(article)
-                    if result is not None:
-                        self.interesting_articles.append(result)
-
-            # Cancel timeout
-            self._cancel_timeout()
+                self._time_remaining()
+                self.interesting_articles.extend(self.process_articles(articles))
 
             # Print summary
             self._print_summary()
@@ -257,17 +325,23 @@ class NewsAgent:
             raise
 
         finally:
-            # Generate RSS feed from new interesting articles + existing items
-            try:
-                count = generate_rss_feed(
-                    self.interesting_articles,
-                    self.existing_items,
-                    output_path=Config.FEED_PATH,
-                )
-                logger.info(f"Generated RSS feed with {count} items")
-            except Exception as e:
-                logger.error(f"RSS feed generation failed: {e}")
-
+            if not self.interesting_articles and Path(Config.FEED_PATH).exists():
+                # Nothing new: the feed on disk is already correct
+                logger.info("No new items; skipping RSS regeneration")
+            else:
+                # Generate RSS feed from new interesting articles + existing items
+                try:
+                    count = generate_rss_feed(
+                        self.interesting_articles,
+                        self.existing_items,
+                        output_path=Config.FEED_PATH,
+                    )
+                    logger.info(f"Generated RSS feed with {count} items")
+                except Exception as e:
+                    logger.error(f"RSS feed generation failed: {e}")
+
+            self.session.close()
+            self.llm_agent.close()
             logger.info("News Agent run complete")
 
     def _print_summary(self):
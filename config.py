@@ -1,30 +1,37 @@
 """Configuration and guardrails for the news agent."""
 
 import os
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class Config:
-    """Agent configuration with built-in guardrails."""
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Agent configuration with built-in guardrails.
+
+    Frozen and slotted: reads are plain slot loads and nothing can
+    mutate settings mid-run. Use the module-level ``Config`` instance.
+    """
     
     # === RESOURCE LIMITS ===
     MAX_ARTICLES_PER_RUN: int = 50
     MAX_ARTICLE_LENGTH: int = 10000  # characters
     MAX_SUMMARY_LENGTH: int = 500  # characters
     MAX_RUNTIME_SECONDS: int = 300  # 5 minutes
+    MAX_WORKERS: int = 8  # concurrent article fetches / LLM calls
     
     # === FEED SAFETY ===
-    ALLOWED_FEEDS: List[str] = [
+    ALLOWED_FEEDS: Tuple[str, ...] = (
         "https://scholarlykitchen.sspnet.org/feed/",
         "https://www.the-geyser.com/rss/",
         "https://www.platformer.news/rss/",
         "https://www.404media.co/rss/",
         "https://www.wheresyoured.at/rss/",
         "https://www.publishersweekly.com/pw/feeds/section/industry-news/index.xml",
-    ]
+    )
     
     # === NETWORK SAFETY ===
     REQUEST_TIMEOUT: int = 10  # seconds
@@ -38,28 +45,37 @@ class Config:
     # === CLAUDE SETTINGS ===
     CLAUDE_API_KEY: str = os.environ.get("CLAUDE_API_KEY", "")
     CLAUDE_MODEL: str = "claude-haiku-4-5-20251001"
-    CLAUDE_TIMEOUT: int = 30
+    CLAUDE_TIMEOUT: int = 120  # seconds per request; batched interest checks return many verdicts
+    INTEREST_BATCH_SIZE: int = 15  # articles per interest-check request (bounds max_tokens)
+    INTEREST_CONTENT_CHARS: int = 2000  # article text sent per interest check
     
     # === LOGGING ===
     LOG_LEVEL: str = "INFO"
     SAVE_PROMPTS: bool = True
-    PROMPT_VERSION: str = "1.0"
+    PROMPT_VERSION: str = "1.4"
+    LLM_CACHE_MAX_AGE_DAYS: int = 30  # cached Claude results older than this are pruned; 0 = keep forever
     
     # === USER INTERESTS ===
     # Your hardcoded interests for filtering
-    INTERESTS: List[str] = [
+    INTERESTS: Tuple[str, ...] = (
         "new tools and technology in scholarly publishing, including what they are and what they do",
         "partnerships and collaborations between publishing organizations",
         "publishing platforms and infrastructure",
         "scholarly publishing industry trends and developments",
-    ]
+    )
     
     # === PATHS ===
     FEED_PATH: str = "docs/feed.xml"
+    FEED_INDEX_PATH: str = "data/feed_index.pkl"  # parsed feed.xml, keyed on mtime/size
+    FEED_HTTP_CACHE_PATH: str = "data/feed_http_cache.pkl"  # ETag/Last-Modified + last body per feed
+    LLM_CACHE_PATH: str = "data/llm_cache.sqlite3"  # parsed Claude results, keyed on model/version/input
     LOG_PATH: str = "logs/agent.log"
     PROMPTS_DIR: str = "prompts"
 
 
+Config = _Config()
+
+
 # Validate configuration on import
 def validate_config():
     """Validate configuration settings."""
@@ -1,86 +1,226 @@
 """Article content extraction for the news agent."""
 
+import functools
 import requests
 import logging
 import ipaddress
 import socket
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Final, Optional
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 import re
 
+import lxml.html
+from lxml import etree
+
 from config import Config
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
+_WS_RE: Final = re.compile(r'\s+')
+_NL_RE: Final = re.compile(r'\n{3,}')
+# C0 controls except newline, DEL and C1 controls, deleted via str.translate
+_CTRL_DELETE: Final = dict.fromkeys(
+    [i for i in range(0x20) if i != ord('\n')] + list(range(0x7f, 0xa0))
+)
+# Boilerplate elements dropped before text extraction
+_STRIP_TAGS: Final = ('script', 'style', 'nav', 'header', 'footer', 'aside')
+# Article body classes, in priority order
+_CONTENT_CLASSES: Final = ('post-content', 'article-content', 'entry-content')
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_non_public_ip(address: str) -> bool:
+    """Check whether an IP address is private, reserved, loopback or link-local.
+
+    Args:
+        address: IP address string as returned by getaddrinfo
+
+    Returns:
+        True if the address must not be fetched from
+
+    Raises:
+        ValueError: If address is not a valid IP address
+    """
+    ip = ipaddress.ip_address(address)
+    return ip.is_private or ip.is_reserved or ip.is_loopback or ip.is_link_local
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolves_to_public(hostname: str) -> bool:
+    """Resolve a hostname and check none of its addresses are private/reserved.
+
+    Cached per hostname: article URLs cluster on a handful of hosts, so
+    each is resolved once instead of once per URL. Resolution failures
+    raise instead of returning, so they are never cached.
+
+    Args:
+        hostname: Hostname to resolve
+
+    Returns:
+        True if every resolved address is public, False otherwise
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    addr_info = socket.getaddrinfo(hostname, None)
+    # getaddrinfo repeats each address once per socket type
+    for address in {sockaddr[0] for _, _, _, _, sockaddr in addr_info}:
+        if _is_non_public_ip(address):
+            logger.warning(f"Rejected private/reserved IP {address} for host: {hostname}")
+            return False
+    return True
+
+
+def _is_public_host(hostname: str) -> bool:
+    """Check a hostname resolves only to public addresses.
+
+    A failed lookup rejects the host for this call only, so a transient
+    DNS error doesn't block the host for the rest of the run.
+
+    Args:
+        hostname: Hostname to resolve
+
+    Returns:
+        True if every resolved address is public, False otherwise
+    """
+    try:
+        return _resolves_to_public(hostname)
+    except (socket.gaierror, ValueError):
+        logger.warning(f"Could not resolve hostname: {hostname}")
+        return False
+
+
+def _is_safe_url(url: str) -> bool:
+    """Validate URL to prevent SSRF attacks.
+
+    Rejects private IPs, localhost, and non-HTTP(S) schemes.
+
+    Args:
+        url: URL to validate
+
+    Returns:
+        True if URL is safe, False otherwise
+    """
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+
+    if parsed.scheme not in ('http', 'https'):
+        logger.warning(f"Rejected non-HTTP(S) URL scheme: {parsed.scheme}")
+        return False
+
+    hostname = parsed.hostname
+    if not hostname:
+        return False
+
+    # Reject localhost
+    if hostname in ('localhost', '127.0.0.1', '::1', '0.0.0.0'):
+        logger.warning(f"Rejected localhost URL: {url}")
+        return False
+
+    # Resolve hostname and check for private/reserved IPs
+    if not _is_public_host(hostname):
+        logger.warning(f"Rejected URL with non-public host: {url}")
+        return False
+
+    return True
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath equivalent of the CSS class selector ``.class_name``."""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _content_priority(element: etree._Element) -> int:
+    """Rank a main-content candidate; lower ranks are tried first.
+
+    Order: <article>, role="main", the _CONTENT_CLASSES in turn, <main>.
+    """
+    if element.tag == 'article':
+        return 0
+    if element.get('role') == 'main':
+        return 1
+    classes = (element.get('class') or '').split()
+    for rank, class_name in enumerate(_CONTENT_CLASSES, 2):
+        if class_name in classes:
+            return rank
+    return 2 + len(_CONTENT_CLASSES)
+
 
 class ContentExtractor:
     """Extracts clean article text from web pages."""
 
-    MAX_RESPONSE_BYTES = 10 * 1024 * 1024  # 10 MB
+    __slots__ = ('timeout', 'max_length', 'min_length', 'session',
+                 '_owns_session', '_content_cache')
+
+    MAX_RESPONSE_BYTES: Final = 10 * 1024 * 1024  # 10 MB
 
-    def __init__(self):
+    # Common article containers, collected in a single traversal
+    MAIN_CONTENT_XPATH = etree.XPath(" | ".join((
+        "//article",
+        "//*[@role='main']",
+        *(_class_xpath(name) for name in _CONTENT_CLASSES),
+        "//main",
+    )))
+
+    def __init__(self, session: Optional[requests.Session] = None):
         self.timeout = Config.REQUEST_TIMEOUT
         self.max_length = Config.MAX_ARTICLE_LENGTH
         self.min_length = Config.MIN_ARTICLE_LENGTH
+        # Pooled session so repeat requests to a host reuse the TCP/TLS connection
+        self._owns_session = session is None
+        self.session = session or create_session()
+        # URL -> extracted text (None for failures), kept for the extractor's lifetime
+        self._content_cache: Dict[str, Optional[str]] = {}
+
+    def close(self):
+        """Release pooled connections (only if this extractor created the session)."""
+        if self._owns_session:
+            self.session.close()
+
+    def clear_cache(self):
+        """Drop memoized content and host/IP verdicts (for long-running processes)."""
+        self._content_cache.clear()
+        _resolves_to_public.cache_clear()
+        _is_non_public_ip.cache_clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _validate_url(self, url: str) -> bool:
         """Validate URL to prevent SSRF attacks.
 
-        Rejects private IPs, localhost, and non-HTTP(S) schemes.
-
         Args:
             url: URL to validate
 
         Returns:
             True if URL is safe, False otherwise
         """
-        try:
-            parsed = urlparse(url)
-        except ValueError:
-            return False
-
-        if parsed.scheme not in ('http', 'https'):
-            logger.warning(f"Rejected non-HTTP(S) URL scheme: {parsed.scheme}")
-            return False
+        return _is_safe_url(url)
 
-        hostname = parsed.hostname
-        if not hostname:
-            return False
-
-        # Reject localhost
-        if hostname in ('localhost', '127.0.0.1', '::1', '0.0.0.0'):
-            logger.warning(f"Rejected localhost URL: {url}")
-            return False
+    def _fetch_and_parse(self, url: str) -> Optional[etree._Element]:
+        """Fetch a page and parse it incrementally as bytes arrive.
 
-        # Resolve hostname and check for private/reserved IPs
-        try:
-            addr_info = socket.getaddrinfo(hostname, None)
-            for _, _, _, _, sockaddr in addr_info:
-                ip = ipaddress.ip_address(sockaddr[0])
-                if ip.is_private or ip.is_reserved or ip.is_loopback or ip.is_link_local:
-                    logger.warning(f"Rejected private/reserved IP for URL: {url}")
-                    return False
-        except (socket.gaierror, ValueError):
-            logger.warning(f"Could not resolve hostname for URL: {url}")
-            return False
-
-        return True
-
-    def _fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content from URL.
+        Chunks are fed straight into an lxml HTML parser, so the full
+        document is never held as a separate bytes or str copy.
 
         Args:
             url: Article URL
 
         Returns:
-            HTML content as string, or None if fetch fails
+            Root element of the parsed page, or None if fetch/parse fails
         """
         if not self._validate_url(url):
             return None
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 timeout=self.timeout,
                 headers={
@@ -97,18 +237,27 @@ class ContentExtractor:
                 response.close()
                 return None
 
-            # Read with size limit
-            chunks = []
+            # Only force an encoding the server actually declared; otherwise
+            # let the parser honour <meta charset> in the document
+            content_type = response.headers.get('Content-Type', '')
+            if 'charset' in content_type.lower() and response.encoding:
+                parser = lxml.html.HTMLParser(encoding=response.encoding)
+            else:
+                parser = lxml.html.HTMLParser()
+
+            # Feed with size limit
             bytes_read = 0
-            for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
-                bytes_read += len(chunk.encode('utf-8')) if isinstance(chunk, str) else len(chunk)
+            for chunk in response.iter_content(chunk_size=8192):
+                bytes_read += len(chunk)
                 if bytes_read > self.MAX_RESPONSE_BYTES:
                     logger.warning(f"Response exceeded size limit ({self.MAX_RESPONSE_BYTES} bytes): {url}")
                     response.close()
                     return None
-                chunks.append(chunk if isinstance(chunk, str) else chunk.decode('utf-8', errors='replace'))
+                parser.feed(chunk)
 
-            return ''.join(chunks)
+            if not bytes_read:
+                return None
+            return parser.close()
 
         except requests.Timeout:
             logger.warning(f"Timeout fetching URL: {url}")
@@ -116,48 +265,47 @@ class ContentExtractor:
         except requests.RequestException as e:
             logger.warning(f"Error fetching URL {url}: {e}")
             return None
+        except (etree.ParserError, etree.XMLSyntaxError, LookupError) as e:
+            logger.warning(f"Error parsing HTML from {url}: {e}")
+            return None
     
-    def _extract_text(self, html: str) -> str:
-        """Extract clean text from HTML.
+    def _extract_text_from_tree(self, tree: etree._Element) -> str:
+        """Extract clean text from a parsed HTML document.
         
         Args:
-            html: HTML content
+            tree: Root element of the parsed page
             
         Returns:
             Cleaned text content
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            script.decompose()
+        # Remove boilerplate elements, keeping the text that follows them;
+        # the space stops it from merging with the text before
+        for element in tree.iter(etree.Comment, *_STRIP_TAGS):
+            if element.tail:
+                element.tail = ' ' + element.tail
+        etree.strip_elements(tree, etree.Comment, *_STRIP_TAGS, with_tail=False)
         
         # Try to find main content area
-        # Common article containers
-        article_selectors = [
-            'article',
-            '[role="main"]',
-            '.post-content',
-            '.article-content',
-            '.entry-content',
-            'main'
-        ]
+        # One pass finds every candidate in document order; keep the first
+        # of each kind and try them in priority order
+        candidates = {}
+        for element in self.MAIN_CONTENT_XPATH(tree):
+            candidates.setdefault(_content_priority(element), element)
         
         text = ""
-        for selector in article_selectors:
-            content = soup.select_one(selector)
-            if content:
-                text = content.get_text(separator=' ', strip=True)
+        for _, element in sorted(candidates.items()):
+            text = ' '.join(element.itertext())
+            if text.strip():
                 break
         
         # Fallback to body if no article content found
-        if not text:
-            body = soup.find('body')
-            if body:
-                text = body.get_text(separator=' ', strip=True)
+        if not text.strip():
+            body = tree.find('.//body')
+            if body is not None:
+                text = ' '.join(body.itertext())
         
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         return text
     
@@ -174,10 +322,13 @@ class ContentExtractor:
         # (This is basic - real prompt injection defense is complex)
         
         # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _NL_RE.sub('\n\n', text)
         
-        # Remove control characters except newline
-        text = ''.join(char for char in text if char.isprintable() or char == '\n')
+        # Remove control characters except newline in one C-level pass;
+        # other non-printables (rare format/separator chars) take the slow path
+        text = text.translate(_CTRL_DELETE)
+        if not text.replace('\n', ' ').isprintable():
+            text = ''.join(char for char in text if char.isprintable() or char == '\n')
         
         return text
     
@@ -193,17 +344,36 @@ class ContentExtractor:
         if len(text) > self.max_length:
             logger.debug(f"Truncating text from {len(text)} to {self.max_length} chars")
             # Truncate at word boundary near limit
-            truncated = text[:self.max_length]
-            last_space = truncated.rfind(' ')
-            if last_space > 0:
-                truncated = truncated[:last_space]
-            return truncated + "..."
+            last_space = text.rfind(' ', 0, self.max_length)
+            if last_space <= 0:
+                last_space = self.max_length
+            return text[:last_space] + "..."
         
         return text
     
     def extract_content(self, url: str) -> Optional[str]:
         """Extract full article content from URL.
         
+        Results (including failures) are memoized per URL, so retries and
+        repeated URLs within a run don't refetch the page.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            Cleaned article text, or None if extraction fails
+        """
+        if url in self._content_cache:
+            logger.debug(f"Content cache hit: {url}")
+            return self._content_cache[url]
+        
+        text = self._extract_content(url)
+        self._content_cache[url] = text
+        return text
+    
+    def _extract_content(self, url: str) -> Optional[str]:
+        """Fetch and extract article content, bypassing the cache.
+        
         Args:
             url: Article URL
             
@@ -212,13 +382,13 @@ class ContentExtractor:
         """
         logger.debug(f"Extracting content from: {url}")
         
-        # Fetch HTML
-        html = self._fetch_html(url)
-        if not html:
+        # Fetch and parse HTML
+        tree = self._fetch_and_parse(url)
+        if tree is None:
             return None
         
         # Extract text
-        text = self._extract_text(html)
+        text = self._extract_text_from_tree(tree)
         
         # Check minimum length
         if len(text) < self.min_length:
@@ -237,6 +407,9 @@ class ContentExtractor:
     def extract_batch(self, urls: list) -> dict:
         """Extract content from multiple URLs.
         
+        Pages are fetched concurrently (up to Config.MAX_WORKERS at once),
+        since each one is dominated by network latency.
+        
         Args:
             urls: List of article URLs
             
@@ -244,14 +417,15 @@ class ContentExtractor:
             Dictionary mapping URL to extracted content (or None if failed)
         """
         results = {}
+        max_workers = max(1, min(Config.MAX_WORKERS, len(urls)))
         
-        for i, url in enumerate(urls, 1):
-            logger.info(f"Extracting content {i}/{len(urls)}: {url[:60]}...")
-            content = self.extract_content(url)
-            results[url] = content
-            
-            if content is None:
-                logger.warning(f"Failed to extract content from: {url}")
+        logger.info(f"Extracting content from {len(urls)} URLs ({max_workers} workers)...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for url, content in zip(urls, executor.map(self.extract_content, urls)):
+                results[url] = content
+                
+                if content is None:
+                    logger.warning(f"Failed to extract content from: {url}")
         
         success_count = sum(1 for v in results.values() if v is not None)
         logger.info(f"Successfully extracted {success_count}/{len(urls)} articles")
@@ -269,8 +443,8 @@ def extract_article_content(url: str) -> Optional[str]:
     Returns:
         Cleaned article text, or None if extraction fails
     """
-    extractor = ContentExtractor()
-    return extractor.extract_content(url)
+    with ContentExtractor() as extractor:
+        return extractor.extract_content(url)
 
 
 if __name__ == "__main__":
@@ -314,5 +488,6 @@ if __name__ == "__main__":
     results = extractor.extract_batch(test_urls[:2])
     print(f"\n✓ Batch extraction complete")
     print(f"  Success: {sum(1 for v in results.values() if v)}/{len(results)}")
+    extractor.close()
     
     print("\n✓ Content extractor test complete!")
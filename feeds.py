@@ -3,27 +3,97 @@
 import feedparser
 import requests
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+import os
+import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from urllib.parse import urlparse
 
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from config import Config
+from http_session import create_session
 
 logger = logging.getLogger(__name__)
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_feed_date(value: str) -> Optional[datetime]:
+    """Parse a raw feed date string (RFC 822 or ISO 8601).
+    
+    Args:
+        value: Date string as it appears in the feed
+        
+    Returns:
+        Naive UTC datetime, or None if the string isn't a recognizable date
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        if _ISO_DATE_RE.match(value):
+            dt = datetime.fromisoformat(value.rstrip("Z"))
+        else:
+            dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _description_text(raw_description: str) -> str:
+    """Extract plain text from a feed entry's HTML description.
+
+    Parses with lxml directly, since only the text is needed; falls back
+    to BeautifulSoup for input lxml rejects (e.g. control characters).
+
+    Args:
+        raw_description: Description/summary HTML from the feed entry
+
+    Returns:
+        Whitespace-normalized description text
+    """
+    # Empty or plain-text summaries are common and need no parser
+    if not raw_description:
+        return ''
+    if '<' not in raw_description and '&' not in raw_description:
+        return raw_description.strip()
+
+    try:
+        fragment = lxml.html.fragment_fromstring(raw_description, create_parent='div')
+    except (etree.ParserError, ValueError):
+        return BeautifulSoup(raw_description, 'lxml').get_text(separator=' ', strip=True)
+
+    # Blank out code blocks, keeping the text that follows them separate
+    for element in fragment.iter('script', 'style'):
+        element.text = None
+    return ' '.join(s.strip() for s in fragment.itertext() if s.strip())
+
 
 class Article:
     """Represents a parsed article from an RSS feed."""
     
+    __slots__ = ('url', 'title', 'source', 'pub_date', 'description', 'pub_date_dt')
+    
     def __init__(self, url: str, title: str, source: str, 
-                 pub_date: str, description: str = ""):
+                 pub_date: str, description: str = "",
+                 pub_date_dt: Optional[datetime] = None):
         self.url = url
         self.title = title
         self.source = source
         self.pub_date = pub_date
         self.description = description
+        # Parsed once at ingestion so later filters don't re-parse pub_date
+        self.pub_date_dt = pub_date_dt
     
     def __repr__(self):
         return f"Article(title='{self.title[:50]}...', source='{self.source}')"
@@ -42,9 +112,54 @@ class Article:
 class FeedFetcher:
     """Fetches and parses RSS feeds with safety guardrails."""
     
-    def __init__(self):
-        self.allowed_feeds = Config.ALLOWED_FEEDS
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Set for whitelist checks; ordered, de-duplicated tuple for fetching
+        self.allowed_feeds = frozenset(Config.ALLOWED_FEEDS)
+        self._feed_order = tuple(dict.fromkeys(Config.ALLOWED_FEEDS))
         self.timeout = Config.REQUEST_TIMEOUT
+        self.max_age_days = Config.MAX_ARTICLE_AGE_DAYS
+        # The whitelist is fixed, so each feed's source name is derived once
+        self._source_names = {url: self._source_name_from_url(url) for url in self._feed_order}
+        # Pooled session so repeat requests to a host reuse the TCP/TLS connection
+        self.session = session or create_session(pool_connections=len(self.allowed_feeds))
+        # feed_url -> (etag, last_modified, body) from the last 200 response
+        self._http_cache = self._load_http_cache()
+        self._http_cache_dirty = False
+        self._http_cache_lock = threading.Lock()
+    
+    def _load_http_cache(self) -> Dict[str, Tuple[Optional[str], Optional[str], bytes]]:
+        """Load conditional-GET validators and bodies saved by a previous run.
+        
+        Returns:
+            Mapping of feed URL to (etag, last_modified, body); empty if unavailable
+        """
+        cache_path = Path(Config.FEED_HTTP_CACHE_PATH)
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable feed HTTP cache {cache_path}: {e}")
+        return {}
+    
+    def _save_http_cache(self):
+        """Persist the conditional-GET cache if any feed changed this run."""
+        if not self._http_cache_dirty:
+            return
+        
+        cache_path = Path(Config.FEED_HTTP_CACHE_PATH)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._http_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._http_cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write feed HTTP cache {cache_path}: {e}")
     
     def _is_feed_allowed(self, feed_url: str) -> bool:
         """Check if feed URL is in whitelist.
@@ -66,18 +181,24 @@ class FeedFetcher:
         Returns:
             Domain name as source identifier
         """
-        parsed = urlparse(feed_url)
-        domain = parsed.netloc.replace('www.', '')
-        return domain
+        source_name = self._source_names.get(feed_url)
+        if source_name is None:
+            source_name = self._source_name_from_url(feed_url)
+        return source_name
     
-    def _parse_date(self, entry) -> str:
+    @staticmethod
+    def _source_name_from_url(feed_url: str) -> str:
+        """Derive the source name (domain without www.) from a feed URL."""
+        return urlparse(feed_url).netloc.replace('www.', '')
+    
+    def _parse_date(self, entry) -> datetime:
         """Parse publication date from feed entry.
         
         Args:
             entry: feedparser entry object
             
         Returns:
-            ISO format date string
+            Publication datetime (naive, UTC)
         """
         # Try multiple date fields
         for date_field in ['published_parsed', 'updated_parsed', 'created_parsed']:
@@ -85,18 +206,28 @@ class FeedFetcher:
                 parsed_date = getattr(entry, date_field)
                 if parsed_date:
                     try:
-                        return datetime(*parsed_date[:6]).isoformat()
+                        return datetime(*parsed_date[:6])
                     except (TypeError, ValueError):
                         continue
         
+        # feedparser leaves *_parsed empty for formats it doesn't know;
+        # try the raw strings before giving up
+        for date_field in ['published', 'updated', 'created']:
+            parsed_date = _parse_feed_date(entry.get(date_field, ''))
+            if parsed_date:
+                return parsed_date
+        
         # Fallback to current time if no date found
-        return datetime.now().isoformat()
+        return datetime.now()
     
-    def fetch_feed(self, feed_url: str) -> List[Article]:
+    def fetch_feed(self, feed_url: str,
+                   existing_urls: Optional[set] = None) -> List[Article]:
         """Fetch and parse a single RSS feed.
         
         Args:
             feed_url: URL of the RSS feed
+            existing_urls: URLs already processed; matching entries are
+                skipped before their dates and descriptions are parsed
             
         Returns:
             List of Article objects
@@ -112,16 +243,33 @@ class FeedFetcher:
         logger.info(f"Fetching feed: {feed_url}")
         
         try:
+            # Conditional GET: unchanged feeds answer 304 with no body
+            headers = {'User-Agent': 'NewsAgent/1.0'}
+            cached = self._http_cache.get(feed_url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
             # Fetch feed with timeout
-            response = requests.get(
+            response = self.session.get(
                 feed_url,
                 timeout=self.timeout,
-                headers={'User-Agent': 'NewsAgent/1.0'}
+                headers=headers
             )
-            response.raise_for_status()
             
-            # Parse feed
-            feed = feedparser.parse(response.content)
+            if response.status_code == 304 and cached:
+                logger.info(f"Feed unchanged since last run: {feed_url}")
+                body = cached[2]
+            else:
+                response.raise_for_status()
+                body = response.content
+                self._update_http_cache(feed_url, response, body)
+            
+            # Parse feed (unchanged feeds still go through the existing_urls skip)
+            feed = feedparser.parse(body)
             
             if feed.bozo:
                 # Feed has parsing issues but might still be usable
@@ -130,29 +278,50 @@ class FeedFetcher:
             # Extract articles
             articles = []
             source_name = self._get_source_name(feed_url)
+            cutoff_date = None
+            if self.max_age_days > 0:
+                cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
+            too_old = 0
+            already_seen = 0
             
             for entry in feed.entries:
                 # Extract article data
                 url = entry.get('link', '')
                 title = entry.get('title', 'Untitled')
-                raw_description = entry.get('summary', entry.get('description', ''))
-                description = BeautifulSoup(raw_description, 'html.parser').get_text(separator=' ', strip=True)
-                pub_date = self._parse_date(entry)
                 
                 # Skip entries without URLs
                 if not url:
                     logger.debug(f"Skipping entry without URL: {title}")
                     continue
                 
+                # Cheap set lookup first: known URLs never reach the parsers
+                if existing_urls and url in existing_urls:
+                    already_seen += 1
+                    continue
+                
+                # Apply the age limit before paying for description parsing
+                pub_date_dt = self._parse_date(entry)
+                if cutoff_date is not None and pub_date_dt < cutoff_date:
+                    too_old += 1
+                    continue
+                
+                raw_description = entry.get('summary', entry.get('description', ''))
+                description = _description_text(raw_description)
+                
                 article = Article(
                     url=url,
                     title=title,
                     source=source_name,
-                    pub_date=pub_date,
-                    description=description
+                    pub_date=pub_date_dt.isoformat(),
+                    description=description,
+                    pub_date_dt=pub_date_dt
                 )
                 articles.append(article)
             
+            if already_seen:
+                logger.info(f"Skipped {already_seen} already-processed articles from {source_name}")
+            if too_old:
+                logger.info(f"Filtered {too_old} articles older than {self.max_age_days} days from {source_name}")
             logger.info(f"Fetched {len(articles)} articles from {source_name}")
             return articles
             
@@ -166,41 +335,94 @@ class FeedFetcher:
             logger.error(f"Unexpected error parsing feed {feed_url}: {e}")
             return []
     
-    def fetch_all_feeds(self) -> List[Article]:
+    def _update_http_cache(self, feed_url: str, response: requests.Response, body: bytes):
+        """Remember a feed's validators and body for the next run's conditional GET.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            response: Successful response for the feed
+            body: Response body
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._http_cache_lock:
+            if etag or last_modified:
+                self._http_cache[feed_url] = (etag, last_modified, body)
+                self._http_cache_dirty = True
+            elif self._http_cache.pop(feed_url, None) is not None:
+                self._http_cache_dirty = True
+    
+    def fetch_all_feeds(self, existing_urls: Optional[set] = None) -> List[Article]:
         """Fetch all configured RSS feeds.
         
+        Feeds are fetched in parallel (bounded by Config.MAX_WORKERS) since
+        each one is dominated by network latency; results keep feed order.
+        Entries whose URL is in existing_urls, or that an earlier feed
+        already returned, are dropped.
+        
+        Args:
+            existing_urls: URLs already processed (None to keep everything)
+        
         Returns:
-            List of all articles from all feeds
+            List of all new articles from all feeds, first occurrence kept
         """
         all_articles = []
+        seen = set()
+        duplicates = 0
+        max_workers = max(1, min(Config.MAX_WORKERS, len(self._feed_order)))
         
-        for feed_url in self.allowed_feeds:
-            try:
-                articles = self.fetch_feed(feed_url)
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Failed to fetch feed {feed_url}: {e}")
-                # Continue with other feeds
-                continue
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (feed_url, executor.submit(self.fetch_feed, feed_url, existing_urls))
+                for feed_url in self._feed_order
+            ]
+            for feed_url, future in futures:
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch feed {feed_url}: {e}")
+                    # Continue with other feeds
+                    continue
+                
+                # The same post syndicated by more than one feed
+                for article in articles:
+                    if article.url in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(article.url)
+                    all_articles.append(article)
+        
+        self._save_http_cache()
         
-        logger.info(f"Fetched {len(all_articles)} total articles from {len(self.allowed_feeds)} feeds")
+        if duplicates:
+            logger.info(f"Filtered {duplicates} duplicate articles")
+        logger.info(f"Fetched {len(all_articles)} total articles from {len(self._feed_order)} feeds")
         return all_articles
     
     def deduplicate_articles(self, articles: List[Article], 
                             existing_urls: set) -> List[Article]:
         """Remove duplicate articles based on URL.
         
+        fetch_all_feeds(existing_urls) already does this while parsing;
+        this is for callers holding a list fetched some other way.
+        
+        Drops articles already in existing_urls as well as repeats within
+        articles itself (the same post syndicated by more than one feed),
+        so each URL is only fetched and sent to the LLM once.
+        
         Args:
             articles: List of articles to deduplicate
             existing_urls: Set of URLs already in database
             
         Returns:
-            List of new articles not in existing_urls
+            List of new articles not in existing_urls, first occurrence kept
         """
-        new_articles = [
-            article for article in articles 
-            if article.url not in existing_urls
-        ]
+        seen = set(existing_urls)
+        new_articles = []
+        for article in articles:
+            if article.url not in seen:
+                seen.add(article.url)
+                new_articles.append(article)
         
         duplicates = len(articles) - len(new_articles)
         if duplicates > 0:
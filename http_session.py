@@ -0,0 +1,32 @@
+"""Shared HTTP session setup for the news agent."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+
+
+def create_session(pool_connections: int = 16,
+                   pool_maxsize: int = 32) -> requests.Session:
+    """Create a requests.Session with keep-alive pooling and retries.
+
+    Connections (and their TLS sessions) are reused across requests to the
+    same host, and transient connection errors are retried with backoff.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=Config.MAX_RETRIES, backoff_factor=0.3),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
@@ -3,7 +3,7 @@
 from pathlib import Path
 from config import Config
 
-EMPTY_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+EMPTY_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
   <channel>
     <title>Scholarly Publishing News</title>
@@ -14,5 +14,5 @@ EMPTY_FEED = """<?xml version="1.0" encoding="UTF-8"?>
 
 path = Path(Config.FEED_PATH)
 path.parent.mkdir(parents=True, exist_ok=True)
-path.write_text(EMPTY_FEED, encoding="utf-8")
+path.write_bytes(EMPTY_FEED)
 print(f"Reset {Config.FEED_PATH} — next run will reprocess all articles.")
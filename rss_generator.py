@@ -2,68 +2,98 @@
 
 import os
 import re
-import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 from email.utils import format_datetime
-from typing import List
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from lxml import etree as ET
 
 from feeds import Article
 
+# Control characters that XML 1.0 forbids (lxml rejects them outright)
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
-def generate_rss_feed(
-    new_articles: List[Article],
-    existing_items: List[dict],
-    output_path: str = "docs/feed.xml",
-    max_items: int = 50,
-) -> int:
-    """Generate an RSS 2.0 feed from new articles prepended to existing items.
+# Written verbatim ahead of the streamed document
+_XML_PROLOG = b'<?xml version="1.0" encoding="UTF-8"?>\n'
 
-    Args:
-        new_articles: Article objects rated interesting this run
-        existing_items: Dicts parsed from current feed.xml (title, url, description, pub_date, source)
-        output_path: Path to write the RSS XML file
-        max_items: Maximum number of items to include
 
-    Returns:
-        Number of items written to the feed
-    """
-    # Build RSS structure
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
+class FeedItem:
+    """An item already published in feed.xml."""
+
+    __slots__ = ('url', 'title', 'description', 'pub_date', 'source')
+
+    def __init__(self, url: str = "", title: str = "", description: str = "",
+                 pub_date: str = "", source: str = ""):
+        self.url = url
+        self.title = title
+        self.description = description
+        self.pub_date = pub_date
+        self.source = source
+
+
+def _xml_text(text: str) -> str:
+    """Strip characters that cannot appear in an XML document."""
+    return _INVALID_XML_CHARS.sub("", text) if text else text
+
+
+def _cdata(text: str):
+    """Wrap text in a CDATA section, or leave it for normal escaping if it can't be."""
+    text = _xml_text(text)
+    if not text or "]]>" in text:
+        return text
+    return ET.CDATA(text)
+
+
+def _rfc822(dt: Optional[datetime]) -> str:
+    """Format a datetime (naive means UTC, None means now) as an RFC 822 date."""
+    if dt is None:
+        dt = datetime.now(timezone.utc)
+    elif dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt)
 
-    ET.SubElement(channel, "title").text = "Scholarly Publishing News - Curated Feed"
-    ET.SubElement(channel, "description").text = (
+
+def _channel_header() -> List[ET._Element]:
+    """Build the channel-level elements that precede the items."""
+    title = ET.Element("title")
+    title.text = "Scholarly Publishing News - Curated Feed"
+    description = ET.Element("description")
+    description.text = _cdata(
         "AI-curated news about tools, technology, and partnerships in scholarly publishing"
     )
-    ET.SubElement(channel, "link").text = "https://scholarlykitchen.sspnet.org"
-    ET.SubElement(channel, "language").text = "en-us"
-    ET.SubElement(channel, "lastBuildDate").text = format_datetime(
-        datetime.now(timezone.utc)
-    )
+    link = ET.Element("link")
+    link.text = "https://scholarlykitchen.sspnet.org"
+    language = ET.Element("language")
+    language.text = "en-us"
+    last_build = ET.Element("lastBuildDate")
+    last_build.text = format_datetime(datetime.now(timezone.utc))
+    return [title, description, link, language, last_build]
+
 
+def _feed_items(
+    new_articles: List[Article],
+    existing_items: List[FeedItem],
+    max_items: int,
+) -> Iterator[ET._Element]:
+    """Yield <item> elements: new articles first, then existing items, deduped by URL."""
     count = 0
     seen_urls: set = set()
 
     # Prepend new articles first
     for article in new_articles:
         if count >= max_items:
-            break
+            return
         if article.url in seen_urls:
             continue
         seen_urls.add(article.url)
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = article.title
+        item = ET.Element("item")
+        ET.SubElement(item, "title").text = _xml_text(article.title)
         ET.SubElement(item, "link").text = article.url
-        ET.SubElement(item, "description").text = article.description or ""
+        ET.SubElement(item, "description").text = _cdata(article.description or "")
 
-        if article.pub_date:
-            try:
-                dt = datetime.fromisoformat(article.pub_date)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                ET.SubElement(item, "pubDate").text = format_datetime(dt)
-            except (ValueError, TypeError):
-                pass
+        # Parsed once at ingestion; no need to re-parse the ISO string
+        ET.SubElement(item, "pubDate").text = _rfc822(article.pub_date_dt)
 
         if article.source:
             source_el = ET.SubElement(
@@ -74,48 +104,86 @@ def generate_rss_feed(
         guid = ET.SubElement(item, "guid", isPermaLink="true")
         guid.text = article.url
         count += 1
+        yield item
 
     # Append existing items
     for existing in existing_items:
         if count >= max_items:
-            break
-        url = existing.get("url", "")
+            return
+        url = existing.url
         if url in seen_urls:
             continue
         seen_urls.add(url)
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = existing.get("title", "")
+        item = ET.Element("item")
+        ET.SubElement(item, "title").text = _xml_text(existing.title)
         ET.SubElement(item, "link").text = url
-        ET.SubElement(item, "description").text = existing.get("description", "")
+        ET.SubElement(item, "description").text = _cdata(existing.description)
 
-        if existing.get("pub_date"):
-            ET.SubElement(item, "pubDate").text = existing["pub_date"]
+        if existing.pub_date:
+            ET.SubElement(item, "pubDate").text = existing.pub_date
 
-        if existing.get("source"):
+        if existing.source:
             source_el = ET.SubElement(
-                item, "source", url=f"https://{existing['source']}"
+                item, "source", url=f"https://{existing.source}"
             )
-            source_el.text = existing["source"]
+            source_el.text = existing.source
 
         guid = ET.SubElement(item, "guid", isPermaLink="true")
         guid.text = url
         count += 1
+        yield item
 
-    # Pretty-print and serialize
-    ET.indent(rss)
-    tree_str = ET.tostring(rss, encoding="unicode")
 
-    # Wrap <description> content in CDATA sections
-    tree_str = re.sub(
-        r"<description>(.*?)</description>",
-        lambda m: f"<description><![CDATA[{m.group(1)}]]></description>",
-        tree_str,
-        flags=re.DOTALL,
-    )
+def generate_rss_feed(
+    new_articles: List[Article],
+    existing_items: List[FeedItem],
+    output_path: str = "docs/feed.xml",
+    max_items: int = 50,
+) -> int:
+    """Generate an RSS 2.0 feed from new articles prepended to existing items.
 
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        f.write(tree_str)
+    Items are streamed to disk one at a time with lxml's incremental
+    writer, so the full document is never built as a tree or a string.
+
+    Args:
+        new_articles: Article objects rated interesting this run
+        existing_items: FeedItems parsed from current feed.xml
+        output_path: Path to write the RSS XML file
+        max_items: Maximum number of items to include
+
+    Returns:
+        Number of items written to the feed
+    """
+    output_dir = os.path.dirname(output_path) or "."
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    # Write to a sibling temp file and swap it in atomically, so a crash
+    # mid-write never leaves a torn feed.xml behind
+    tmp_path = Path(output_path).with_suffix(".xml.tmp")
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_XML_PROLOG)
+            with ET.xmlfile(f, encoding="utf-8") as xf:
+                with xf.element("rss", version="2.0"):
+                    xf.write("\n  ")
+                    with xf.element("channel"):
+                        for element in _channel_header():
+                            xf.write("\n    ")
+                            xf.write(element)
+                        for item in _feed_items(new_articles, existing_items, max_items):
+                            # Indent to sit two levels deep, matching pretty_print
+                            ET.indent(item, space="  ", level=2)
+                            xf.write("\n    ")
+                            xf.write(item)
+                            count += 1
+                        xf.write("\n  ")
+                    xf.write("\n")
+            f.write(b"\n")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # Don't leave a partial temp file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     return count